@@ -1,9 +1,51 @@
 """The Clash Royale integration."""
-from homeassistant.core import HomeAssistant
+import logging
+
+import aiohttp
+from aiohttp.hdrs import USER_AGENT
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor"]
 
+DATA_SESSION = "clash_royale_session"
+
+
+@callback
+def async_get_api_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the private session for the Clash Royale API, creating it on first use.
+
+    All requests go to a single host, so a small pool with a DNS cache keeps
+    sockets warm between the requests of a config flow. The session lives
+    until Home Assistant shuts down.
+    """
+    session = hass.data.get(DATA_SESSION)
+    if session is None:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=4,
+                limit_per_host=2,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                ssl=get_default_context(),
+            ),
+            headers={USER_AGENT: SERVER_SOFTWARE},
+        )
+        hass.data[DATA_SESSION] = session
+
+        async def _async_close_session(event: Event) -> None:
+            await hass.data.pop(DATA_SESSION).close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    return session
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up from a config entry."""
     
@@ -17,6 +59,55 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate old config entries."""
+    if entry.version > 2:
+        # Entry was created by a newer version of the integration (downgrade)
+        return False
+
+    if entry.version == 1:
+        # Version 1 stored the tag as typed and had no unique_id
+        player_tag = (entry.data.get("player_tag") or "").strip().lstrip("#").upper()
+        player_tag = f"#{player_tag}"
+
+        # The sensor's unique_id is derived from the tag
+        new_unique_id = f"clash_royale_{player_tag}".replace("#", "")
+        ent_reg = er.async_get(hass)
+        entity_id = ent_reg.async_get_entity_id("sensor", "clash_royale", new_unique_id)
+
+        # Version 1 compared tags case-sensitively, so the same player can be
+        # configured twice; the entry that already owns the unique_id or the
+        # normalized sensor id keeps them
+        duplicate = any(
+            other.entry_id != entry.entry_id and other.unique_id == player_tag
+            for other in hass.config_entries.async_entries("clash_royale")
+        ) or (
+            entity_id is not None
+            and ent_reg.async_get(entity_id).config_entry_id != entry.entry_id
+        )
+        if duplicate:
+            _LOGGER.warning("Player %s is configured more than once", player_tag)
+            hass.config_entries.async_update_entry(entry, version=2)
+            return True
+
+        @callback
+        def _async_migrate_unique_id(entity_entry: er.RegistryEntry) -> dict | None:
+            if entity_entry.unique_id == new_unique_id:
+                return None
+            return {"new_unique_id": new_unique_id}
+
+        await er.async_migrate_entries(hass, entry.entry_id, _async_migrate_unique_id)
+
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, "player_tag": player_tag},
+            unique_id=player_tag,
+            version=2,
+        )
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
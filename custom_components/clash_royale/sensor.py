@@ -41,21 +41,22 @@ class ClashRoyaleDataUpdateCoordinator(DataUpdateCoordinator):
                 if response.status == 200:
                     return await response.json()
                 elif response.status == 403:
-                    error_msg = await response.text()
-                    _LOGGER.error(f"Invalid API token (403 Forbidden): {error_msg}")
+                    # Cap the body read, error pages can be large
+                    error_msg = (await response.content.read(2048)).decode("utf-8", errors="replace")
+                    _LOGGER.error("Invalid API token (403 Forbidden): %s", error_msg)
                     raise UpdateFailed(f"Invalid API token: {error_msg}")
                 elif response.status == 404:
                     _LOGGER.error("Player not found (404)")
                     raise UpdateFailed(f"Player {self.player_tag} not found")
                 else:
-                    _LOGGER.error(f"API error: {response.status}")
+                    _LOGGER.error("API error: %s", response.status)
                     raise UpdateFailed(f"API returned status {response.status}")
         
         except UpdateFailed:
             # Re-raise UpdateFailed without wrapping it again or logging it again
             raise
         except Exception as err:
-            _LOGGER.error(f"Error fetching data: {err}")
+            _LOGGER.error("Error fetching data: %s", err)
             raise UpdateFailed(f"Error fetching data: {err}")
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):